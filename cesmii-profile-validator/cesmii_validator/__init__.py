@@ -4,6 +4,7 @@ from .validator import (
     ProfileValidator,
     ValidationError,
     ValidationResult,
+    close_connections,
     load_profile,
     validate_payload,
 )
@@ -13,6 +14,7 @@ __all__ = [
     "ProfileValidator",
     "ValidationError",
     "ValidationResult",
+    "close_connections",
     "load_profile",
     "validate_payload",
 ]
@@ -6,16 +6,31 @@ Supports OPC UA data types and nested profile references.
 """
 
 import json
-import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 from pathlib import Path
 from typing import Any
+from urllib.error import URLError
 from urllib.parse import urlparse
-from urllib.request import urlopen
+from urllib.request import getproxies, urlopen
 
+try:
+    # Optional accelerator: orjson parses several times faster than stdlib
+    # json. Picked up automatically when installed; no API change.
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
-@dataclass
+try:
+    # Optional accelerator: vectorized range checks for large numeric arrays
+    import numpy as _np
+except ImportError:
+    _np = None
+
+
+@dataclass(slots=True)
 class ValidationError:
     """Represents a single validation error."""
 
@@ -31,7 +46,7 @@ class ValidationError:
         return msg
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating a payload against a profile."""
 
@@ -46,44 +61,119 @@ class ValidationResult:
             f"  - {e}" for e in self.errors
         )
 
+    def release(self) -> None:
+        """
+        Return this result's errors to the shared pool for reuse.
+
+        Optional: callers validating many payloads can release results they
+        are done with so later validations reuse the ValidationError
+        instances instead of allocating fresh ones. The result's errors must
+        not be accessed afterwards.
+        """
+        if not self.errors:
+            return
+        pool = _ERR_POOL
+        for err in self.errors:
+            if len(pool) >= _ERR_POOL_MAX:
+                break
+            pool.append(err)
+        self.errors = []
+
+
+# Shared result for the common no-error, no-warning case, so validating a
+# clean payload allocates nothing. Empty tuples keep it safely immutable.
+_VALID_RESULT = ValidationResult(valid=True, errors=(), warnings=())
+
+# Free-list of ValidationError instances returned via ValidationResult.release,
+# capped so a one-off error flood doesn't pin memory
+_ERR_POOL: list[ValidationError] = []
+_ERR_POOL_MAX = 256
+
+
+def _new_error(
+    path: str,
+    message: str,
+    expected: str | None = None,
+    actual: str | None = None,
+) -> ValidationError:
+    """Build a ValidationError, reusing a pooled instance when one is free."""
+    try:
+        err = _ERR_POOL.pop()
+    except IndexError:
+        return ValidationError(path, message, expected, actual)
+    err.path = path
+    err.message = message
+    err.expected = expected
+    err.actual = actual
+    return err
+
+
+# The datetime/UTC/GUID formats are fixed-shape, so plain indexed character
+# checks beat the regex engine for these short strings.
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _has_iso_datetime_prefix(value: str) -> bool:
+    """Check for a YYYY-MM-DDTHH:MM:SS prefix without the regex engine."""
+    return (
+        len(value) >= 19
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] == "T"
+        and value[13] == ":"
+        and value[16] == ":"
+        and value[0:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:10].isdigit()
+        and value[11:13].isdigit()
+        and value[14:16].isdigit()
+        and value[17:19].isdigit()
+    )
+
 
 # OPC UA Data Type Validators
 # Based on OPC UA Part 6 - Data Types
 
+# The numeric validators use type(value) is int rather than isinstance: it is
+# a pointer compare in CPython, and it stops bool (an int subclass) from
+# silently passing the integer validators.
+
 def _is_valid_boolean(value: Any) -> bool:
-    return isinstance(value, bool)
+    return type(value) is bool
 
 
 def _is_valid_int16(value: Any) -> bool:
-    return isinstance(value, int) and -32768 <= value <= 32767
+    return type(value) is int and -32768 <= value <= 32767
 
 
 def _is_valid_int32(value: Any) -> bool:
-    return isinstance(value, int) and -2147483648 <= value <= 2147483647
+    return type(value) is int and -2147483648 <= value <= 2147483647
 
 
 def _is_valid_int64(value: Any) -> bool:
-    return isinstance(value, int) and -9223372036854775808 <= value <= 9223372036854775807
+    return type(value) is int and -9223372036854775808 <= value <= 9223372036854775807
 
 
 def _is_valid_uint16(value: Any) -> bool:
-    return isinstance(value, int) and 0 <= value <= 65535
+    return type(value) is int and 0 <= value <= 65535
 
 
 def _is_valid_uint32(value: Any) -> bool:
-    return isinstance(value, int) and 0 <= value <= 4294967295
+    return type(value) is int and 0 <= value <= 4294967295
 
 
 def _is_valid_uint64(value: Any) -> bool:
-    return isinstance(value, int) and 0 <= value <= 18446744073709551615
+    return type(value) is int and 0 <= value <= 18446744073709551615
 
 
 def _is_valid_float(value: Any) -> bool:
-    return isinstance(value, (int, float))
+    t = type(value)
+    return t is float or t is int
 
 
 def _is_valid_double(value: Any) -> bool:
-    return isinstance(value, (int, float))
+    t = type(value)
+    return t is float or t is int
 
 
 def _is_valid_string(value: Any) -> bool:
@@ -92,27 +182,105 @@ def _is_valid_string(value: Any) -> bool:
 
 def _is_valid_datetime(value: Any) -> bool:
     """Validate ISO 8601 datetime string."""
-    if not isinstance(value, str):
-        return False
-    # Basic ISO 8601 pattern
-    pattern = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}"
-    return bool(re.match(pattern, value))
+    return isinstance(value, str) and _has_iso_datetime_prefix(value)
 
 
 def _is_valid_utctime(value: Any) -> bool:
     """Validate UTC time string (must end with Z)."""
-    if not isinstance(value, str):
-        return False
-    pattern = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}.*Z$"
-    return bool(re.match(pattern, value))
+    return (
+        isinstance(value, str)
+        and value.endswith("Z")
+        and _has_iso_datetime_prefix(value)
+    )
 
 
 def _is_valid_guid(value: Any) -> bool:
     """Validate GUID/UUID string."""
-    if not isinstance(value, str):
+    if not isinstance(value, str) or len(value) != 36:
+        return False
+    if value[8] != "-" or value[13] != "-" or value[18] != "-" or value[23] != "-":
+        return False
+    hexset = _HEX_DIGITS
+    return (
+        all(c in hexset for c in value[0:8])
+        and all(c in hexset for c in value[9:13])
+        and all(c in hexset for c in value[14:18])
+        and all(c in hexset for c in value[19:23])
+        and all(c in hexset for c in value[24:36])
+    )
+
+
+def _is_valid_timezone(value: Any) -> bool:
+    """Boolean-only check of the TimeZoneDataType structure."""
+    return (
+        isinstance(value, dict)
+        and _is_valid_int16(value.get("offset"))
+        and _is_valid_boolean(value.get("daylightSavingInOffset"))
+    )
+
+
+# Bounds and acceptable numpy dtype kinds for the numeric OPC types, keyed by
+# validator. Used to vectorize validation of large homogeneous arrays.
+_NUMERIC_ARRAY_BOUNDS = {
+    _is_valid_int16: (-32768, 32767, "iu"),
+    _is_valid_int32: (-2147483648, 2147483647, "iu"),
+    _is_valid_int64: (-9223372036854775808, 9223372036854775807, "iu"),
+    _is_valid_uint16: (0, 65535, "iu"),
+    _is_valid_uint32: (0, 4294967295, "iu"),
+    _is_valid_uint64: (0, 18446744073709551615, "iu"),
+    _is_valid_float: (None, None, "iuf"),
+    _is_valid_double: (None, None, "iuf"),
+}
+
+# Below this length the per-element Python loop beats the numpy conversion
+_NUMERIC_ARRAY_MIN = 64
+
+
+def _check_numeric_array(
+    value: list,
+    path: str,
+    bounds: tuple,
+    validator_fn: Any,
+    type_desc: str,
+    errors: list,
+) -> bool:
+    """
+    Validate a numeric array with numpy reductions instead of per-element calls.
+
+    Returns True if the array was handled (valid, or offenders reported),
+    False if the caller should fall back to the per-element loop.
+    """
+    if _np is None or len(value) < _NUMERIC_ARRAY_MIN:
+        return False
+    try:
+        arr = _np.asarray(value)
+    except (TypeError, ValueError, OverflowError):
+        return False
+    lo, hi, kinds = bounds
+    if arr.dtype.kind not in kinds:
         return False
-    pattern = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
-    return bool(re.match(pattern, value))
+    # np.asarray coerces bool (an int subclass) and numpy scalars into the
+    # numeric dtype, so a passing dtype does not prove exact element types.
+    # A cheap type scan keeps semantics identical to the per-element
+    # validators; contaminated arrays fall back so offenders get reported.
+    if kinds == "iu":
+        if not all(type(item) is int for item in value):
+            return False
+    elif not all(type(item) is float or type(item) is int for item in value):
+        return False
+    if lo is not None and (arr.min() < lo or arr.max() > hi):
+        # Out-of-range values present; per-element pass reports the offenders
+        for i, item in enumerate(value):
+            if not validator_fn(item):
+                errors.append(
+                    _new_error(
+                        path=f"{path}[{i}]",
+                        message="Invalid type",
+                        expected=type_desc,
+                        actual=type(item).__name__,
+                    )
+                )
+    return True
 
 
 # Map OPC UA type identifiers to validators
@@ -133,6 +301,72 @@ OPC_TYPE_VALIDATORS: dict[str, tuple[callable, str]] = {
     "opc:Guid": (_is_valid_guid, "GUID/UUID"),
 }
 
+# Table-driven form of OPC_TYPE_VALIDATORS: each known type gets a small
+# integer id, with parallel tuples mapping ids to validator functions and
+# descriptions. Plan building resolves the type URI to an id once and then
+# indexes the tuples instead of unpacking dict values.
+_OPC_ID: dict[str, int] = {
+    opc_type: i for i, opc_type in enumerate(OPC_TYPE_VALIDATORS)
+}
+_OPC_FNS = tuple(fn for fn, _ in OPC_TYPE_VALIDATORS.values())
+_OPC_DESCS = tuple(desc for _, desc in OPC_TYPE_VALIDATORS.values())
+
+
+# Sentinel for absent payload fields, so a single dict lookup covers both the
+# presence check and the value fetch.
+_MISSING = object()
+
+
+# Keep-alive connections reused across load_profile calls, keyed by
+# (scheme, host, port). Profiles are typically fetched in batches from one
+# host, so reuse skips the TCP/TLS handshake after the first request.
+_CONN_CACHE: dict[tuple[str, str, int | None], HTTPConnection] = {}
+
+
+def close_connections() -> None:
+    """Close any keep-alive connections pooled by load_profile."""
+    while _CONN_CACHE:
+        _, conn = _CONN_CACHE.popitem()
+        conn.close()
+
+
+def _open_url(url: str):
+    """Open a GET request for url, reusing a pooled per-host connection."""
+    if getproxies():
+        # A direct connection would bypass the http_proxy/https_proxy
+        # handling that urlopen honors
+        return urlopen(url)
+
+    parsed = urlparse(url)
+    key = (parsed.scheme, parsed.hostname or "", parsed.port)
+    path = parsed.path or "/"
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+
+    for attempt in range(2):
+        conn = _CONN_CACHE.get(key)
+        if conn is None:
+            conn_cls = HTTPSConnection if parsed.scheme == "https" else HTTPConnection
+            conn = conn_cls(parsed.hostname, parsed.port)
+            _CONN_CACHE[key] = conn
+        try:
+            conn.request("GET", path, headers={"Connection": "keep-alive"})
+            response = conn.getresponse()
+            break
+        except (OSError, HTTPException) as exc:
+            # Stale keep-alive connection; drop it and retry once fresh.
+            # Persistent failures surface as URLError, as urlopen's would.
+            _CONN_CACHE.pop(key, None)
+            conn.close()
+            if attempt:
+                raise URLError(exc) from exc
+
+    if response.status != 200:
+        # Redirects and friends: let urllib handle them as a one-off
+        response.read()
+        return urlopen(url)
+    return response
+
 
 def load_profile(source: str | Path) -> dict[str, Any]:
     """
@@ -147,9 +381,15 @@ def load_profile(source: str | Path) -> dict[str, Any]:
     source_str = str(source)
 
     if source_str.startswith(("http://", "https://")):
-        with urlopen(source_str) as response:
-            return json.loads(response.read().decode("utf-8"))
+        with _open_url(source_str) as response:
+            if _orjson is not None:
+                return _orjson.loads(response.read())
+            # json.load consumes the response stream directly; no need to
+            # materialize the body as bytes and decode it first
+            return json.load(response)
     else:
+        if _orjson is not None:
+            return _orjson.loads(Path(source).read_bytes())
         with open(source, "r") as f:
             return json.load(f)
 
@@ -165,16 +405,30 @@ class ProfileValidator:
     - TimeZoneDataType structure validation
     """
 
-    def __init__(self, profile: dict[str, Any], referenced_profiles: dict[str, dict] | None = None):
+    def __init__(
+        self,
+        profile: dict[str, Any],
+        referenced_profiles: dict[str, dict] | None = None,
+        _nested_cache: dict[int, "ProfileValidator"] | None = None,
+    ):
         """
         Initialize validator with a profile.
 
         Args:
             profile: The CESMII SM Profile (parsed JSON-LD)
             referenced_profiles: Dict mapping namespace URIs to profile dicts for nested types
+            _nested_cache: Shared cache of validators for referenced profiles,
+                keyed by profile identity (internal, propagated to nested validators)
         """
         self.profile = profile
         self.referenced_profiles = referenced_profiles or {}
+        self._nested_cache = _nested_cache if _nested_cache is not None else {}
+        # Index referenced profiles by their exact namespace key and @id so
+        # the common case is a single dict lookup instead of a substring scan
+        self._ns_index: dict[str, dict] = {}
+        for ns, ref_profile in self.referenced_profiles.items():
+            self._ns_index[ns] = ref_profile
+            self._ns_index.setdefault(ref_profile.get("@id", ""), ref_profile)
         self._parse_profile()
 
     def _parse_profile(self) -> None:
@@ -199,59 +453,253 @@ class ProfileValidator:
         # Parse context for type information
         self.context = self.profile.get("@context", {})
 
-    def _get_type_from_context(self, field_name: str) -> str | None:
-        """Get the OPC UA type for a field from the @context."""
-        ctx_entry = self.context.get(field_name)
-        if isinstance(ctx_entry, dict):
-            return ctx_entry.get("@type")
-        return None
-
-    def _validate_opc_type(
-        self, value: Any, opc_type: str, path: str
-    ) -> list[ValidationError]:
-        """Validate a value against an OPC UA data type."""
-        errors = []
+        # Flatten each field definition into a (field_name, validator_fn,
+        # type_desc, profile_ref, is_array) tuple so validate() doesn't
+        # re-walk the profile dicts or hit OPC_TYPE_VALIDATORS per payload.
+        # validator_fn is a bool predicate for plain OPC types, the
+        # structured _validate_timezone check (type_desc None) for
+        # TimeZoneDataType, or None for unknown/custom types.
+        self._field_plan: list[tuple[str, Any, str | None, str | None, bool]] = []
+        for field_name, field_def in self.fields.items():
+            if type(field_name) is str:
+                # Interned names make the repeated payload lookups and key
+                # comparisons identity-based across validations
+                field_name = sys.intern(field_name)
+            data_type_def = field_def.get("cesmii:dataType", {})
+            if isinstance(data_type_def, dict):
+                opc_type = data_type_def.get("@id")
+                profile_ref = data_type_def.get("cesmii:profileReference")
+            else:
+                opc_type = None
+                profile_ref = None
+            if not opc_type:
+                # Fall back to the @context entry for the field
+                ctx_entry = self.context.get(field_name)
+                if isinstance(ctx_entry, dict):
+                    opc_type = ctx_entry.get("@type")
+            is_array = field_def.get("cesmii:isArray", False)
 
-        if opc_type in OPC_TYPE_VALIDATORS:
-            validator, type_desc = OPC_TYPE_VALIDATORS[opc_type]
-            if not validator(value):
-                errors.append(
-                    ValidationError(
-                        path=path,
-                        message=f"Invalid type",
-                        expected=type_desc,
-                        actual=type(value).__name__,
+            type_id = _OPC_ID.get(opc_type, -1) if opc_type else -1
+            if type_id >= 0:
+                validator_fn = _OPC_FNS[type_id]
+                type_desc = _OPC_DESCS[type_id]
+            elif opc_type == "opc:TimeZoneDataType":
+                validator_fn, type_desc = self._validate_timezone, None
+            else:
+                # Unknown types pass through (could be custom types)
+                validator_fn, type_desc = None, None
+            self._field_plan.append(
+                (field_name, validator_fn, type_desc, profile_ref, is_array)
+            )
+
+        # Keyed plan for the payload-driven sparse path in validate()
+        self._field_plan_map: dict[str, tuple] = {
+            entry[0]: entry for entry in self._field_plan
+        }
+
+        # Specialize the plan into a straight-line function for this profile
+        self._compiled_validate = self._compile_validator()
+
+    def _compile_validator(self):
+        """
+        Generate a validate function specialized to this profile.
+
+        The per-field checks are fully known once the plan is built, so we
+        emit them as straight-line source and exec it: no plan iteration, no
+        dispatch branches and no per-field dict walks at validation time.
+        Appends ValidationErrors to the errors list passed by the caller.
+        """
+        namespace: dict[str, Any] = {
+            "_MISSING": _MISSING,
+            "_Error": _new_error,
+            "_tz": self._validate_timezone,
+            "_nested": self._validate_nested_profile,
+            "_nested_arr": self._validate_nested_array,
+            "_numarr": _check_numeric_array,
+        }
+        lines = ["def _compiled(payload, path_prefix, errors):"]
+        emit = lines.append
+
+        for idx, (field_name, validator_fn, type_desc, profile_ref, is_array) in enumerate(
+            self._field_plan
+        ):
+            if validator_fn is None and not profile_ref and not is_array:
+                # Unknown scalar types pass through; nothing to emit
+                continue
+
+            path_expr = (
+                f"path_prefix + {'.' + field_name!r} if path_prefix else {field_name!r}"
+            )
+            emit(f"    v = payload.get({field_name!r}, _MISSING)")
+
+            if is_array:
+                namespace[f"_ref{idx}"] = profile_ref
+                namespace[f"_f{idx}"] = validator_fn
+                namespace[f"_d{idx}"] = type_desc
+                emit("    if v is not _MISSING:")
+                emit(f"        path = {path_expr}")
+                emit("        if not isinstance(v, list):")
+                emit(
+                    "            errors.append(_Error(path=path,"
+                    " message='Expected array', expected='array',"
+                    " actual=type(v).__name__))"
+                )
+                if profile_ref:
+                    emit("        else:")
+                    emit(f"            _nested_arr(v, _ref{idx}, path, errors)")
+                elif validator_fn is not None and type_desc is None:
+                    emit("        else:")
+                    emit("            for i, item in enumerate(v):")
+                    emit(f"                _f{idx}(item, f'{{path}}[{{i}}]', errors)")
+                elif validator_fn is not None:
+                    bounds = _NUMERIC_ARRAY_BOUNDS.get(validator_fn)
+                    if bounds is not None:
+                        # Large homogeneous numeric arrays take the
+                        # vectorized check; _numarr returning False falls
+                        # through to the per-element loop
+                        namespace[f"_nb{idx}"] = bounds
+                        emit(
+                            f"        elif _numarr(v, path, _nb{idx}, _f{idx},"
+                            f" _d{idx}, errors):"
+                        )
+                        emit("            pass")
+                        emit("        else:")
+                    else:
+                        emit("        else:")
+                    emit("            for i, item in enumerate(v):")
+                    emit(f"                if not _f{idx}(item):")
+                    emit(
+                        "                    errors.append(_Error(path=f'{path}[{i}]',"
+                        f" message='Invalid type', expected=_d{idx},"
+                        " actual=type(item).__name__))"
                     )
+            elif profile_ref:
+                namespace[f"_ref{idx}"] = profile_ref
+                emit("    if v is not _MISSING:")
+                emit(f"        _nested(v, _ref{idx}, ({path_expr}), errors)")
+            elif type_desc is None:
+                # Structured TimeZoneDataType check
+                namespace[f"_f{idx}"] = validator_fn
+                emit("    if v is not _MISSING:")
+                emit(f"        _tz(v, ({path_expr}), errors)")
+            else:
+                namespace[f"_f{idx}"] = validator_fn
+                namespace[f"_d{idx}"] = type_desc
+                emit(f"    if v is not _MISSING and not _f{idx}(v):")
+                emit(
+                    f"        errors.append(_Error(path=({path_expr}),"
+                    f" message='Invalid type', expected=_d{idx},"
+                    " actual=type(v).__name__))"
                 )
-        elif opc_type == "opc:TimeZoneDataType":
-            errors.extend(self._validate_timezone(value, path))
-        # Unknown types pass through (could be custom types)
 
-        return errors
+        if len(lines) == 1:
+            emit("    pass")
 
-    def _validate_timezone(self, value: Any, path: str) -> list[ValidationError]:
-        """Validate OPC UA TimeZoneDataType structure."""
-        errors = []
+        exec(compile("\n".join(lines), "<profile-validator>", "exec"), namespace)
+        return namespace["_compiled"]
+
+    def _validate_field(
+        self,
+        entry: tuple,
+        value: Any,
+        path_prefix: str,
+        errors: list[ValidationError],
+    ) -> None:
+        """
+        Validate one payload value against its field-plan entry.
+
+        Error paths are formatted only where they are actually consumed (a
+        failure branch, or a nested/timezone check that needs a prefix), so
+        valid scalar fields allocate no path strings.
+        """
+        field_name, validator_fn, type_desc, profile_ref, is_array = entry
+
+        if is_array:
+            if not isinstance(value, list):
+                errors.append(
+                    _new_error(
+                        path=f"{path_prefix}.{field_name}" if path_prefix else field_name,
+                        message="Expected array",
+                        expected="array",
+                        actual=type(value).__name__,
+                    )
+                )
+                return
+            # Base path is shared by the element paths below
+            path = f"{path_prefix}.{field_name}" if path_prefix else field_name
+            if profile_ref:
+                self._validate_nested_array(value, profile_ref, path, errors)
+            elif validator_fn is None:
+                pass
+            elif type_desc is None:
+                # Structured TimeZoneDataType check
+                for i, item in enumerate(value):
+                    validator_fn(item, f"{path}[{i}]", errors)
+            else:
+                bounds = _NUMERIC_ARRAY_BOUNDS.get(validator_fn)
+                if bounds is not None and _check_numeric_array(
+                    value, path, bounds, validator_fn, type_desc, errors
+                ):
+                    return
+                for i, item in enumerate(value):
+                    if not validator_fn(item):
+                        errors.append(
+                            _new_error(
+                                path=f"{path}[{i}]",
+                                message="Invalid type",
+                                expected=type_desc,
+                                actual=type(item).__name__,
+                            )
+                        )
+        elif profile_ref:
+            self._validate_nested_profile(
+                value,
+                profile_ref,
+                f"{path_prefix}.{field_name}" if path_prefix else field_name,
+                errors,
+            )
+        elif validator_fn is None:
+            pass
+        elif type_desc is None:
+            # Structured TimeZoneDataType check
+            validator_fn(
+                value,
+                f"{path_prefix}.{field_name}" if path_prefix else field_name,
+                errors,
+            )
+        elif not validator_fn(value):
+            errors.append(
+                _new_error(
+                    path=f"{path_prefix}.{field_name}" if path_prefix else field_name,
+                    message="Invalid type",
+                    expected=type_desc,
+                    actual=type(value).__name__,
+                )
+            )
 
+    def _validate_timezone(
+        self, value: Any, path: str, errors: list[ValidationError]
+    ) -> None:
+        """Validate OPC UA TimeZoneDataType structure, appending to errors."""
         if not isinstance(value, dict):
             errors.append(
-                ValidationError(
+                _new_error(
                     path=path,
                     message="TimeZoneDataType must be an object",
                     expected="object with offset and daylightSavingInOffset",
                     actual=type(value).__name__,
                 )
             )
-            return errors
+            return
 
         # Validate offset (Int16)
         if "offset" not in value:
             errors.append(
-                ValidationError(path=f"{path}.offset", message="Missing required field")
+                _new_error(path=f"{path}.offset", message="Missing required field")
             )
         elif not _is_valid_int16(value["offset"]):
             errors.append(
-                ValidationError(
+                _new_error(
                     path=f"{path}.offset",
                     message="Invalid type",
                     expected="integer (-32768 to 32767)",
@@ -262,14 +710,14 @@ class ProfileValidator:
         # Validate daylightSavingInOffset (Boolean)
         if "daylightSavingInOffset" not in value:
             errors.append(
-                ValidationError(
+                _new_error(
                     path=f"{path}.daylightSavingInOffset",
                     message="Missing required field",
                 )
             )
         elif not _is_valid_boolean(value["daylightSavingInOffset"]):
             errors.append(
-                ValidationError(
+                _new_error(
                     path=f"{path}.daylightSavingInOffset",
                     message="Invalid type",
                     expected="boolean",
@@ -277,38 +725,57 @@ class ProfileValidator:
                 )
             )
 
-        return errors
-
-    def _validate_nested_profile(
-        self, value: Any, profile_ref: str, path: str
-    ) -> list[ValidationError]:
-        """Validate a value against a nested/referenced profile."""
-        errors = []
+    def _resolve_profile_ref(self, profile_ref: str) -> dict | None:
+        """Find the referenced profile: exact namespace match first, falling
+        back to the substring scan for partial references."""
+        ref_profile = self._ns_index.get(profile_ref)
 
-        # Try to find the referenced profile
-        ref_profile = None
+        if ref_profile is None:
+            for ns, profile in self.referenced_profiles.items():
+                if ns in profile_ref or profile_ref in ns:
+                    ref_profile = profile
+                    break
+
+        return ref_profile
+
+    def _get_nested_validator(self, ref_profile: dict) -> "ProfileValidator":
+        """Get the cached validator for a referenced profile, so
+        _parse_profile runs once per profile, not once per array element."""
+        nested_validator = self._nested_cache.get(id(ref_profile))
+        if nested_validator is None:
+            nested_validator = ProfileValidator(
+                ref_profile, self.referenced_profiles, _nested_cache=self._nested_cache
+            )
+            self._nested_cache[id(ref_profile)] = nested_validator
+        return nested_validator
 
-        # Check if we have it in referenced_profiles
-        for ns, profile in self.referenced_profiles.items():
-            if ns in profile_ref or profile_ref in ns:
-                ref_profile = profile
-                break
+    def _validate_nested_profile(
+        self, value: Any, profile_ref: str, path: str, errors: list[ValidationError]
+    ) -> None:
+        """Validate a value against a nested/referenced profile, appending to errors."""
+        ref_profile = self._resolve_profile_ref(profile_ref)
 
         if ref_profile is None:
             # Could not find referenced profile - add warning but don't fail
-            return [
-                ValidationError(
+            errors.append(
+                _new_error(
                     path=path,
                     message=f"Could not validate against referenced profile (not loaded): {profile_ref}",
                 )
-            ]
+            )
+            return
 
-        # Create validator for nested profile and validate
-        nested_validator = ProfileValidator(ref_profile, self.referenced_profiles)
-        result = nested_validator.validate(value, path_prefix=path)
+        result = self._get_nested_validator(ref_profile).validate(
+            value, path_prefix=path
+        )
         errors.extend(result.errors)
 
-        return errors
+    def _validate_nested_array(
+        self, value: list, profile_ref: str, path: str, errors: list[ValidationError]
+    ) -> None:
+        """Validate an array of nested-profile elements, appending to errors."""
+        for i, item in enumerate(value):
+            self._validate_nested_profile(item, profile_ref, f"{path}[{i}]", errors)
 
     def validate(
         self, payload: dict[str, Any], path_prefix: str = ""
@@ -328,7 +795,7 @@ class ProfileValidator:
 
         if not isinstance(payload, dict):
             errors.append(
-                ValidationError(
+                _new_error(
                     path=path_prefix or "$",
                     message="Payload must be an object",
                     expected="object",
@@ -344,68 +811,76 @@ class ProfileValidator:
                 f"Payload namespace '{payload_ns}' doesn't match profile namespace '{self.namespace}'"
             )
 
-        # Validate each defined field/attribute
-        for field_name, field_def in self.fields.items():
-            path = f"{path_prefix}.{field_name}" if path_prefix else field_name
-
-            # Check if field exists in payload
-            if field_name not in payload:
-                # For now, treat all fields as optional (could add required field support)
-                continue
-
-            value = payload[field_name]
+        # Fields absent from the payload are treated as optional (could add
+        # required field support). When the payload is much smaller than the
+        # profile, iterate its keys and look up plan entries instead of
+        # probing the payload for every defined field; otherwise run the
+        # specialized per-field checks compiled for this profile.
+        if len(payload) * 4 < len(self._field_plan_map):
+            plan_entry = self._field_plan_map.get
+            for field_name, value in payload.items():
+                entry = plan_entry(field_name)
+                if entry is not None:
+                    self._validate_field(entry, value, path_prefix, errors)
+        else:
+            self._compiled_validate(payload, path_prefix, errors)
 
-            # Get data type from field definition
-            data_type_def = field_def.get("cesmii:dataType", {})
-            opc_type = data_type_def.get("@id") if isinstance(data_type_def, dict) else None
+        if not errors and not warnings:
+            return _VALID_RESULT
+        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
 
-            # Also check context for type
-            if not opc_type:
-                opc_type = self._get_type_from_context(field_name)
+    def is_valid(self, payload: dict[str, Any]) -> bool:
+        """
+        Check a payload against this profile, stopping at the first problem.
 
-            # Check if this is an array field
-            is_array = field_def.get("cesmii:isArray", False)
-            profile_ref = (
-                data_type_def.get("cesmii:profileReference")
-                if isinstance(data_type_def, dict)
-                else None
-            )
+        Equivalent to validate(payload).valid, but builds no error objects
+        or path strings, so callers that only need a boolean skip that work
+        and invalid payloads are rejected at the first failing field.
 
-            if is_array:
-                # Validate array
-                if not isinstance(value, list):
-                    errors.append(
-                        ValidationError(
-                            path=path,
-                            message="Expected array",
-                            expected="array",
-                            actual=type(value).__name__,
-                        )
-                    )
-                else:
-                    # Validate each element
-                    for i, item in enumerate(value):
-                        item_path = f"{path}[{i}]"
-
-                        if profile_ref:
-                            # Nested profile reference
-                            errors.extend(
-                                self._validate_nested_profile(item, profile_ref, item_path)
-                            )
-                        elif opc_type:
-                            errors.extend(
-                                self._validate_opc_type(item, opc_type, item_path)
-                            )
-            else:
-                # Single value
-                if profile_ref:
-                    errors.extend(
-                        self._validate_nested_profile(value, profile_ref, path)
-                    )
-                elif opc_type:
-                    errors.extend(self._validate_opc_type(value, opc_type, path))
+        Args:
+            payload: The payload to validate
 
-        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
+        Returns:
+            True if validate(payload) would report no errors
+        """
+        if not isinstance(payload, dict):
+            return False
+
+        for entry in self._field_plan:
+            value = payload.get(entry[0], _MISSING)
+            if value is not _MISSING and not self._field_is_valid(entry, value):
+                return False
+        return True
+
+    def _field_is_valid(self, entry: tuple, value: Any) -> bool:
+        """Boolean-only counterpart of _validate_field."""
+        _field_name, validator_fn, type_desc, profile_ref, is_array = entry
+
+        if is_array:
+            if not isinstance(value, list):
+                return False
+            if profile_ref:
+                return all(self._nested_is_valid(item, profile_ref) for item in value)
+            if validator_fn is None:
+                return True
+            if type_desc is None:
+                return all(_is_valid_timezone(item) for item in value)
+            return all(validator_fn(item) for item in value)
+        if profile_ref:
+            return self._nested_is_valid(value, profile_ref)
+        if validator_fn is None:
+            return True
+        if type_desc is None:
+            return _is_valid_timezone(value)
+        return validator_fn(value)
+
+    def _nested_is_valid(self, value: Any, profile_ref: str) -> bool:
+        """Boolean-only nested-profile check, mirroring _validate_nested_profile."""
+        ref_profile = self._resolve_profile_ref(profile_ref)
+        if ref_profile is None:
+            # validate() records an error for unresolvable references
+            return False
+        return self._get_nested_validator(ref_profile).is_valid(value)
 
 
 def validate_payload(
@@ -79,6 +79,13 @@ class TestOPCTypeValidation:
         assert len(errors_for_field) == 1
         assert "Invalid type" in errors_for_field[0].message
 
+    def test_bool_not_valid_int32(self, workorder_profile):
+        """bool is an int subclass but should not pass integer validators."""
+        payload = {"WorkOrderNumber": True}
+        result = validate_payload(payload, workorder_profile)
+        errors_for_field = [e for e in result.errors if "WorkOrderNumber" in e.path]
+        assert len(errors_for_field) == 1
+
     def test_valid_double(self, workorder_profile):
         payload = {"Quantity": 108.5}
         result = validate_payload(payload, workorder_profile)
@@ -112,6 +119,42 @@ class TestOPCTypeValidation:
         assert len(errors_for_field) == 1
 
 
+class TestNumericArrayValidation:
+    """Test validation of numeric array fields, including the vectorized path."""
+
+    @pytest.fixture
+    def samples_profile(self):
+        return {
+            "@id": "https://example.com/SamplesV1",
+            "@context": {},
+            "cesmii:attributes": [
+                {
+                    "cesmii:browseName": "Samples",
+                    "cesmii:dataType": {"@id": "opc:Int32"},
+                    "cesmii:isArray": True,
+                }
+            ],
+        }
+
+    def test_large_valid_int_array(self, samples_profile):
+        result = validate_payload({"Samples": list(range(1000))}, samples_profile)
+        assert result.valid
+
+    def test_large_array_out_of_range_element(self, samples_profile):
+        payload = {"Samples": list(range(100)) + [2**40]}
+        result = validate_payload(payload, samples_profile)
+        assert len(result.errors) == 1
+        assert result.errors[0].path == "Samples[100]"
+
+    def test_large_array_bool_element(self, samples_profile):
+        """bool contamination must fail regardless of array length."""
+        samples = [1] * 100
+        samples[50] = True
+        result = validate_payload({"Samples": samples}, samples_profile)
+        assert len(result.errors) == 1
+        assert result.errors[0].path == "Samples[50]"
+
+
 class TestTimeZoneValidation:
     """Test TimeZoneDataType validation."""
 
@@ -207,6 +250,15 @@ class TestFullPayloadValidation:
         assert result.valid
         assert len(result.errors) == 0
 
+    def test_release_recycles_error_instances(self, workorder_profile):
+        result = validate_payload({"WorkOrderNumber": "bad"}, workorder_profile)
+        err = result.errors[0]
+        result.release()
+        assert result.errors == []
+        # The next validation reuses the pooled instance
+        result2 = validate_payload({"WorkOrderNumber": "bad"}, workorder_profile)
+        assert result2.errors[0] is err
+
     def test_validation_result_str(self, workorder_profile):
         payload = {"WorkOrderNumber": "invalid"}
         result = validate_payload(payload, workorder_profile)
@@ -215,6 +267,27 @@ class TestFullPayloadValidation:
         assert "error" in result_str
 
 
+class TestIsValid:
+    """Test the boolean is_valid() fast path."""
+
+    def test_valid_payload(self, workorder_profile, referenced_profiles, valid_payload):
+        validator = ProfileValidator(workorder_profile, referenced_profiles)
+        assert validator.is_valid(valid_payload)
+
+    def test_invalid_payload(self, workorder_profile):
+        validator = ProfileValidator(workorder_profile)
+        assert not validator.is_valid({"WorkOrderNumber": "not-a-number"})
+
+    def test_invalid_nested_element(self, workorder_profile, referenced_profiles):
+        validator = ProfileValidator(workorder_profile, referenced_profiles)
+        payload = {"FeedIngredients": [{"ProductNumber": "not-a-number"}]}
+        assert not validator.is_valid(payload)
+
+    def test_non_dict_payload(self, workorder_profile):
+        validator = ProfileValidator(workorder_profile)
+        assert not validator.is_valid("not-an-object")
+
+
 class TestLoadProfile:
     """Test profile loading."""
 